@@ -12,7 +12,9 @@ setup(name='skrelief',
           'numpy',
           'scipy',
           'sklearn',
-          'julia',
+          'juliacall',
+          'numba',
+          'joblib',
       ],
       classifiers=[
           'Intended Audience :: Developers',
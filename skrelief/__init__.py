@@ -0,0 +1 @@
+from skrelief._distance_cache import clear_distance_cache
@@ -0,0 +1,184 @@
+"""Ball tree backend shared by the SURF-family estimators.
+
+SURF, SURFStar and MultiSURF all work over the identical L1 geometry of the
+data and differ only in their notion of neighborhood, so one parameterized
+scoring implementation serves all three. The ball tree and the reference
+distance sample are cached, so inside one pipeline or grid search they are
+computed once per dataset and reused by every estimator fit on it.
+"""
+
+import weakref
+
+import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.neighbors import BallTree
+
+# Keyed by identity of the user-supplied data array (see make_key). Bounded so
+# long-running sessions over many datasets do not accumulate trees.
+_CACHE = {}
+_MAX_ENTRIES = 8
+_TRACKED = set()
+
+
+def _evict(key):
+    _CACHE.pop(key, None)
+    _TRACKED.discard(key)
+
+
+def make_key(data, converted_dtype, random_state=None):
+    """
+    Build a cache key identifying a user-supplied data array. The key tracks
+    the array's identity (plus shape, dtype, the dtype the backend converts it
+    to and the random_state seeding the reference subsample), and the matching
+    cache entry is evicted when the array is garbage collected, so a recycled
+    id() can never hit a stale entry. Returns None - which disables caching -
+    for inputs that cannot be weakly referenced.
+
+    Args:
+        data (numpy.ndarray): user-supplied matrix of data samples
+        converted_dtype (numpy.dtype): dtype the backend converts data to.
+        random_state (int or numpy.random.Generator): seed the cached entry
+        was (or would be) computed with; estimators with equal seeds share an
+        entry, differing seeds never do.
+
+    Returns:
+        (tuple): cache key, or None
+    """
+
+    if not isinstance(data, np.ndarray):
+        return None
+    key = (id(data), data.shape, str(data.dtype), str(converted_dtype), random_state)
+    if key not in _TRACKED:
+        try:
+            weakref.finalize(data, _evict, key)
+        except TypeError:
+            return None
+        _TRACKED.add(key)
+    return key
+
+
+def get_tree_and_dists(data, key=None, random_state=None):
+    """
+    Return a ball tree over data (L1 metric) and a matrix of distances from all
+    samples to a subsample of up to 100 reference points, computing and caching
+    both on first use for the array identified by key. No caching is done when
+    key is None.
+
+    Args:
+        data (numpy.ndarray): matrix of data samples
+        key (tuple): cache key from make_key(), or None.
+        random_state (int or numpy.random.Generator): seed for drawing the
+        reference subsample; None draws a fresh seed from the OS.
+
+    Returns:
+        (tuple): ball tree and reference distance matrix
+    """
+
+    hit = _CACHE.get(key) if key is not None else None
+    if hit is not None:
+        return hit
+
+    # Distances from all samples to the reference subsample. The subsample is
+    # drawn from a local generator so fits never perturb global numpy state.
+    rng = np.random.default_rng(random_state)
+    n_samples = data.shape[0]
+    ref = rng.choice(n_samples, min(n_samples, 100), replace=False)
+    dists = np.empty((n_samples, ref.size), dtype=np.float64)
+    for idx, r in enumerate(ref):
+        dists[:, idx] = np.sum(np.abs(data - data[r]), 1)
+    tree = BallTree(data, metric='cityblock')
+
+    if key is not None:
+        # Evict the oldest entry once the cache is full.
+        if len(_CACHE) >= _MAX_ENTRIES:
+            _CACHE.pop(next(iter(_CACHE)))
+        _CACHE[key] = (tree, dists)
+    return tree, dists
+
+
+def kdtree_weights(data, target, f_type, variant, n_jobs=1, key=None, random_state=None):
+    """
+    Compute Relief-style feature weights using ball tree radius queries
+    instead of an exhaustive pairwise scan. The "multisurf" variant scores
+    samples within each instance's radius T_i - sigma_i/2, "surf" those
+    within the global mean distance T, and "surfstar" additionally applies
+    the inverted update to samples beyond T.
+
+    Args:
+        data (numpy.ndarray): matrix of data samples
+        target (numpy.ndarray): vector of target values of samples
+        f_type (string): whether features are "continuous" or "discrete".
+        variant (string): one of "multisurf", "surf" and "surfstar".
+        n_jobs (int): number of parallel scoring jobs (joblib semantics).
+        key (tuple): cache key from make_key() identifying the user-supplied
+        array, or None to skip caching.
+        random_state (int or numpy.random.Generator): seed for drawing the
+        reference subsample used to derive the radii.
+
+    Returns:
+        (numpy.ndarray): vector of feature weights
+    """
+
+    data = np.ascontiguousarray(data, dtype=np.float64)
+    n_samples, n_features = data.shape
+
+    # Feature value ranges used to normalize differences of continuous features.
+    f_rng = np.ptp(data, axis=0)
+    f_rng[f_rng == 0] = 1.0
+
+    # The ball tree and the reference distance sample are shared across the
+    # SURF-family estimators fit on the same data.
+    tree, dists = get_tree_and_dists(data, key=key, random_state=random_state)
+    if variant == "multisurf":
+        # Per-instance radius T_i - sigma_i/2.
+        thr = np.mean(dists, 1) - np.std(dists, 1)/2.0
+    else:
+        # Global mean distance T.
+        thr = np.mean(dists)
+
+    # Retrieve samples within the radius of each instance.
+    neighbors = tree.query_radius(data, r=thr)
+
+    # Accumulate weight updates over hits (same class) and misses; for
+    # "surfstar" the samples beyond the radius get the inverted update. The
+    # outer loop is embarrassingly parallel, so it is split into one chunk of
+    # samples per job and the partial weight vectors are summed.
+    def score(samples):
+        weights = np.zeros(n_features, dtype=np.float64)
+        for i in samples:
+            near = neighbors[i]
+            near = near[near != i]
+            groups = ((near, 1.0),)
+            if variant == "surfstar":
+                far_msk = np.ones(n_samples, dtype=np.bool_)
+                far_msk[neighbors[i]] = False
+                far_msk[i] = False
+                groups = ((near, 1.0), (np.flatnonzero(far_msk), -1.0))
+            for neigh, sign in groups:
+                if neigh.size == 0:
+                    continue
+                if f_type == "discrete":
+                    diffs = (data[neigh] != data[i]).astype(np.float64)
+                else:
+                    diffs = np.abs(data[neigh] - data[i]) / f_rng
+                hits_msk = target[neigh] == target[i]
+                if np.any(hits_msk):
+                    weights -= sign*np.mean(diffs[hits_msk], 0)
+                if np.any(~hits_msk):
+                    weights += sign*np.mean(diffs[~hits_msk], 0)
+        return weights
+
+    if effective_n_jobs(n_jobs) == 1:
+        weights = score(range(n_samples))
+    else:
+        chunks = np.array_split(np.arange(n_samples), effective_n_jobs(n_jobs))
+        weights = np.sum(Parallel(n_jobs=n_jobs)(delayed(score)(chunk) for chunk in chunks), 0)
+
+    return weights / n_samples
+
+
+def clear_distance_cache():
+    """Drop all cached neighbor-search structures."""
+
+    _CACHE.clear()
+    _TRACKED.clear()
@@ -0,0 +1,244 @@
+"""Helpers shared by the Julia-backed estimators.
+
+Booting the Julia runtime takes seconds, so nothing in this module imports
+juliacall at import time; the runtime is started lazily through julia_main()
+the first time an estimator actually needs it.
+"""
+
+import os
+
+import numpy as np
+
+_jl = None
+_relief_loaded = False
+_wrap_matrix = None
+_wrap_vector = None
+_jl_types = None
+_cfunc_dist = None
+_numpy_dist = None
+
+
+def julia_main(n_jobs=None):
+    """
+    Start the Julia runtime on first call and return the cached juliacall Main
+    module. Importing skrelief's estimator modules stays cheap; the Julia boot
+    cost is paid once, on the first fit() that uses a Julia backend.
+
+    Args:
+        n_jobs (int): thread count to start the runtime with, following joblib
+        semantics (None or non-positive values mean all cores). Only honored by
+        the call that actually boots the runtime - Julia's thread count is
+        fixed at startup - and overridden by a preexisting
+        PYTHON_JULIACALL_THREADS environment variable.
+
+    Returns:
+        (object): juliacall Main module
+    """
+
+    global _jl, _wrap_matrix, _wrap_vector, _jl_types
+    if _jl is None:
+        # Derive the thread count from the first caller's n_jobs. Whenever
+        # Julia may run threaded, signal handling has to be delegated to it as
+        # well - without it Julia's GC can segfault the process while Python
+        # owns the signal handlers (documented juliacall caveat).
+        if n_jobs is not None and n_jobs > 0:
+            os.environ.setdefault("PYTHON_JULIACALL_THREADS", str(n_jobs))
+        else:
+            os.environ.setdefault("PYTHON_JULIACALL_THREADS", "auto")
+        os.environ.setdefault("PYTHON_JULIACALL_HANDLE_SIGNALS", "yes")
+        from juliacall import Main as jl
+        _jl = jl
+
+        # Wrap a numpy array's memory as a native Julia array without copying.
+        # Matrices must be in column-major (Fortran) order. The caller has to
+        # keep the numpy array alive for the duration of the Julia call.
+        _wrap_matrix = jl.seval("(ptr, n, a, T) -> unsafe_wrap(Matrix{T}, Ptr{T}(UInt(ptr)), (n, a); own=false)")
+        _wrap_vector = jl.seval("(ptr, n, T) -> unsafe_wrap(Vector{T}, Ptr{T}(UInt(ptr)), n; own=false)")
+
+        # numpy dtype -> Julia element type for the zero-copy wrappers.
+        _jl_types = {
+            np.dtype(np.float64): jl.Float64,
+            np.dtype(np.float32): jl.Float32,
+            np.dtype(np.int64): jl.Int64,
+            np.dtype(np.int32): jl.Int32,
+            np.dtype(np.int8): jl.Int8,
+        }
+    return _jl
+
+
+def load_relief(n_jobs=None):
+    """
+    Load the Relief Julia package into the cached runtime, first activating the
+    project named by the SKRELIEF_JULIA_PROJECT environment variable if it is
+    set (useful for development checkouts of Relief). The activation and load
+    run once per process no matter how many estimator modules request them.
+
+    Args:
+        n_jobs (int): thread count forwarded to julia_main() when this call
+        boots the runtime.
+
+    Returns:
+        (object): juliacall Main module with Relief loaded
+    """
+
+    global _relief_loaded
+    jl = julia_main(n_jobs)
+    if not _relief_loaded:
+        project = os.environ.get("SKRELIEF_JULIA_PROJECT")
+        if project is not None:
+            jl.seval("import Pkg")
+            jl.Pkg.activate(os.path.abspath(project))
+        try:
+            jl.seval("using Relief")
+        except Exception as err:
+            raise ImportError("The Relief Julia package could not be loaded. Install it "
+                    "with: julia -e 'import Pkg; Pkg.add(\"Relief\")' or point the "
+                    "SKRELIEF_JULIA_PROJECT environment variable at a Julia project "
+                    "that provides it.") from err
+        _relief_loaded = True
+    return jl
+
+
+def prepare_data(data, f_type, dtype):
+    """
+    Convert data to the column-major layout and element type used by the
+    backends. Continuous data is cast to dtype; discrete data is cast to the
+    narrowest integer type whose range covers its values (int8 when the codes
+    fit, otherwise a wider integer type), so category codes are never
+    silently wrapped.
+
+    Args:
+        data (numpy.ndarray): matrix of data samples
+        f_type (string): whether features are "continuous" or "discrete".
+        dtype (numpy.dtype): target dtype for continuous data.
+
+    Returns:
+        (numpy.ndarray): converted column-major data
+    """
+
+    if f_type == "discrete":
+        data = np.asarray(data)
+        lo, hi = np.min(data), np.max(data)
+        for int_dtype in (np.int8, np.int16, np.int32):
+            info = np.iinfo(int_dtype)
+            if lo >= info.min and hi <= info.max:
+                return np.asfortranarray(data, dtype=int_dtype)
+        return np.asfortranarray(data, dtype=np.int64)
+    return np.asfortranarray(data, dtype=dtype)
+
+
+def cfunc_dist(address):
+    """
+    Build a Julia closure around the raw address of a compiled distance kernel
+    (e.g. a numba.cfunc). The kernel is invoked through ccall, so computing
+    distances does not call back into Python for every sample pair.
+
+    Args:
+        address (int): address of a compiled kernel with signature
+        float64(int64, CPointer(float64), CPointer(float64)).
+
+    Returns:
+        (object): Julia function mapping (x1, x2) to a vector of distances.
+    """
+
+    global _cfunc_dist
+    jl = julia_main()
+    if _cfunc_dist is None:
+        _cfunc_dist = jl.seval("""
+ptr -> (x1, x2) -> begin
+    f = Ptr{Cvoid}(UInt(ptr))
+    x2v = convert(Vector{Float64}, vec(x2))
+    out = Vector{Float64}(undef, size(x1, 1))
+    for i in 1:size(x1, 1)
+        row = convert(Vector{Float64}, vec(x1[i, :]))
+        out[i] = GC.@preserve row x2v ccall(f, Float64, (Int64, Ptr{Float64}, Ptr{Float64}), length(x2v), pointer(row), pointer(x2v))
+    end
+    out
+end
+""")
+    return _cfunc_dist(address)
+
+
+def store_weights(est, weights):
+    """
+    Store fit results on an estimator: a detached float64 copy of the weight
+    vector (so it never aliases backend-owned memory), the indices of the top
+    n_features_to_select columns, and a reset of the lazily computed ranks.
+
+    Args:
+        est (object): estimator being fit.
+        weights (array-like): feature weight vector produced by a backend.
+    """
+
+    # Copy the result into a fresh array so est.weights never aliases
+    # Julia-owned memory or a previous fit's weights.
+    est.weights = np.array(weights, dtype=np.float64)
+
+    # Select the top n_features_to_select columns with a partial sort; the
+    # full rank vector is only built lazily through the rank property. Ties at
+    # the selection boundary are broken by feature index, matching the ordinal
+    # ranks from the rank property, so the selection always equals the columns
+    # with rank <= n_features_to_select.
+    weights = est.weights
+    k = min(est.n_features_to_select, weights.size)
+    if k <= 0:
+        # argpartition on k - 1 would wrap around to the last position.
+        est._selected_cols = np.empty(0, dtype=np.intp)
+    else:
+        kth = weights[np.argpartition(-weights, k - 1)[k - 1]]
+        better = np.flatnonzero(weights > kth)
+        tied = np.flatnonzero(weights == kth)
+        est._selected_cols = np.sort(np.concatenate((better, tied[:k - better.size])))
+    est._rank = None
+
+
+def to_julia(arr):
+    """
+    Hand a numpy array to Julia as a native Array sharing the numpy memory.
+    Falls back to juliacall's default conversion for dtypes without a
+    registered Julia element type.
+
+    Args:
+        arr (numpy.ndarray): one- or two-dimensional array to wrap.
+
+    Returns:
+        (object): Julia Array viewing the same memory, or arr unchanged.
+    """
+
+    julia_main()
+    t = _jl_types.get(arr.dtype)
+    if t is None:
+        return arr
+    # The wrappers read the raw buffer, so it must be contiguous in the
+    # layout Julia expects (column-major for matrices).
+    if arr.ndim == 1 and arr.flags['C_CONTIGUOUS']:
+        return _wrap_vector(arr.ctypes.data, arr.shape[0], t)
+    if arr.ndim == 2 and arr.flags['F_CONTIGUOUS']:
+        return _wrap_matrix(arr.ctypes.data, arr.shape[0], arr.shape[1], t)
+    return arr
+
+
+def numpy_dist(dist_func):
+    """
+    Wrap a plain Python distance function for the Julia backends. Arguments
+    reach the callback converted to numpy float64 arrays - the contract user
+    callbacks were written against - and the value it returns is converted on
+    the Julia side to a native Vector{Float64}, since the result of calling a
+    Python object from Julia is otherwise an unconverted Py that Relief cannot
+    sort or broadcast over.
+
+    Args:
+        dist_func (function): Python distance function taking (x1, x2).
+
+    Returns:
+        (object): Julia function mapping (x1, x2) to a vector of distances.
+    """
+
+    global _numpy_dist
+    jl = julia_main()
+    if _numpy_dist is None:
+        _numpy_dist = jl.seval("f -> (x1, x2) -> pyconvert(Vector{Float64}, f(x1, x2))")
+
+    def wrapped(x1, x2):
+        return dist_func(np.asarray(x1, dtype=np.float64), np.asarray(x2, dtype=np.float64))
+    return _numpy_dist(wrapped)
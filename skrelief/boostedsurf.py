@@ -2,9 +2,29 @@ import numpy as np
 from scipy.stats import rankdata
 from sklearn.base import BaseEstimator, TransformerMixin
 
-from julia import Julia
-Julia(compiled_modules=False)
-from julia import Relief as Relief_jl
+from skrelief._julia import load_relief, numpy_dist
+
+# Handles to the Julia entry points used by fit(), filled in by
+# _julia_handles() on first use so importing this module does not boot Julia.
+_jl_handles = {}
+
+
+def _julia_handles():
+    """
+    Boot the Julia runtime on first call and return the cached handles to the
+    Relief entry points.
+
+    Returns:
+        (dict): mapping of handle names to Julia callables.
+    """
+
+    if not _jl_handles:
+        jl = load_relief()
+
+        # Bind the Julia entry point once so calls in fit() do not re-resolve
+        # the function through the Julia module proxy.
+        _jl_handles['boostedsurf'] = jl.Relief.boostedsurf
+    return _jl_handles
 
 
 class BoostedSURF(BaseEstimator, TransformerMixin):
@@ -53,10 +73,10 @@ class BoostedSURF(BaseEstimator, TransformerMixin):
         # Compute feature weights and rank.
         if self.dist_func is not None:
             # If distance function specified.
-            self.weights = Relief_jl.boostedsurf(data, target, self.phi, self.dist_func, f_type=self.f_type)
+            self.weights = np.array(_julia_handles()['boostedsurf'](data, target, self.phi, numpy_dist(self.dist_func), f_type=self.f_type), dtype=np.float64)
         else:
             # If distance function not specified, use default eighted L1 distance (implemented in Julia).
-            self.weights = Relief_jl.boostedsurf(data, target, self.phi, f_type=self.f_type)
+            self.weights = np.array(_julia_handles()['boostedsurf'](data, target, self.phi, f_type=self.f_type), dtype=np.float64)
         self.rank = rankdata(-self.weights, method='ordinal')
         
         # Return reference to self.
@@ -3,9 +3,29 @@ from sklearn.metrics import pairwise_distances
 from scipy.stats import rankdata
 from sklearn.base import BaseEstimator, TransformerMixin
 
-from julia import Julia
-Julia(compiled_modules=False)
-from julia import Relief as Relief_jl
+from skrelief._julia import load_relief
+
+# Handles to the Julia entry points used by fit(), filled in by
+# _julia_handles() on first use so importing this module does not boot Julia.
+_jl_handles = {}
+
+
+def _julia_handles():
+    """
+    Boot the Julia runtime on first call and return the cached handles to the
+    Relief entry points.
+
+    Returns:
+        (dict): mapping of handle names to Julia callables.
+    """
+
+    if not _jl_handles:
+        jl = load_relief()
+
+        # Bind the Julia entry point once so calls in fit() do not re-resolve
+        # the function through the Julia module proxy.
+        _jl_handles['irelief'] = jl.Relief.irelief
+    return _jl_handles
 
 
 class IRelief(BaseEstimator, TransformerMixin):
@@ -60,8 +80,8 @@ class IRelief(BaseEstimator, TransformerMixin):
         """
 
         # Run I-RELIEF feature selection algorithm.
-        self.weights = Relief_jl.irelief(data, target, self.max_iter, self.k_width, 
-                self.conv_condition, self.initial_w_div, f_type=self.f_type)
+        self.weights = np.array(_julia_handles()['irelief'](data, target, self.max_iter, self.k_width, 
+                self.conv_condition, self.initial_w_div, f_type=self.f_type), dtype=np.float64)
         self.rank = rankdata(-self.weights, method='ordinal')
 
         # Return reference to self.
@@ -1,10 +1,34 @@
 import numpy as np
-from scipy.stats import rankdata
 from sklearn.base import BaseEstimator, TransformerMixin
 
-from julia import Julia
-Julia(compiled_modules=False)
-from julia import Relief as Relief_jl
+from skrelief._distance_cache import kdtree_weights, make_key
+from skrelief._julia import cfunc_dist, load_relief, numpy_dist, prepare_data, store_weights, to_julia
+
+# Handles to the Julia entry points used by fit(), filled in by
+# _julia_handles() on first use so importing this module does not boot Julia.
+_jl_handles = {}
+
+
+def _julia_handles(n_jobs=None):
+    """
+    Boot the Julia runtime on first call, with a thread count derived from
+    n_jobs, and return the cached handles to the Relief entry points.
+
+    Args:
+        n_jobs (int): thread count forwarded to load_relief() when this call
+        boots the runtime.
+
+    Returns:
+        (dict): mapping of handle names to Julia callables.
+    """
+
+    if not _jl_handles:
+        jl = load_relief(n_jobs)
+
+        # Bind the Julia entry point once so calls in fit() do not re-resolve
+        # the function through the Julia module proxy.
+        _jl_handles['surf'] = jl.Relief.surf
+    return _jl_handles
 
 
 class SURF(BaseEstimator, TransformerMixin):
@@ -19,19 +43,49 @@ class SURF(BaseEstimator, TransformerMixin):
         n_features_to_select (int): number of features to select from dataset.
         dist_func (function): function used to measure similarities between samples.
         If equal to None, the default implementation of L1 distance in Julia is used.
+        A numba.cfunc compiled kernel with signature float64(int64, CPointer(float64),
+        CPointer(float64)) is passed to Julia as a raw function pointer and invoked
+        without calling back into Python.
         f_type (string): specifies whether the features are continuous or discrete 
         and can either have the value of "continuous" or "discrete".
+        dtype (numpy.dtype): dtype to which continuous data is cast before computing
+        distances. The default of numpy.float32 halves memory traffic in the distance
+        loop; pass numpy.float64 to keep full precision. Discrete features are cast
+        to the narrowest integer type that can represent their value range (int8
+        where the codes fit).
+        algorithm (string): neighbor search strategy. "brute" (default) uses the
+        exhaustive pairwise scan implemented in Julia; "kdtree" builds a ball tree
+        and only examines samples retrieved by radius queries. The "kdtree" backend
+        always uses L1 distance and ignores dist_func.
+        n_jobs (int): number of parallel jobs used by the "kdtree" backend's scoring
+        loop (joblib semantics, -1 uses all processors). The first fit() to boot
+        the Julia runtime also starts it with this many threads; the count is
+        fixed for the process and a preexisting PYTHON_JULIACALL_THREADS
+        environment variable takes precedence.
+        random_state (int or numpy.random.Generator): seed for the reference
+        subsample the "kdtree" backend draws to derive its radii; None draws a
+        fresh seed from the OS. The "brute" backend is deterministic and
+        ignores it.
 
     Attributes:
         n_features_to_select (int): number of features to select from dataset.
         dist_func (function): function used to measure similarities between samples.
         f_type (string): continuous or discrete features.
+        dtype (numpy.dtype): dtype used for continuous data.
+        algorithm (string): neighbor search strategy.
+        n_jobs (int): number of parallel jobs.
+        random_state (int or numpy.random.Generator): seed for the "kdtree"
+        backend's reference subsample.
     """
-   
-    def __init__(self, n_features_to_select=10, dist_func=None, f_type="continuous"):
+
+    def __init__(self, n_features_to_select=10, dist_func=None, f_type="continuous", dtype=np.float32, algorithm="brute", n_jobs=1, random_state=None):
         self.n_features_to_select = n_features_to_select
         self.dist_func = dist_func
         self.f_type = f_type
+        self.dtype = dtype
+        self.algorithm = algorithm
+        self.n_jobs = n_jobs
+        self.random_state = random_state
 
 
     def fit(self, data, target):
@@ -46,19 +100,76 @@ class SURF(BaseEstimator, TransformerMixin):
             (object): reference to self
         """
 
+        # Julia arrays are column-major - convert data once up front so the
+        # column-wise distance loops in Julia access contiguous memory.
+        # Discrete data is narrowed to the smallest integer type that holds
+        # its value range (see skrelief._julia.prepare_data).
+        raw_data = data
+        data = prepare_data(data, self.f_type, self.dtype)
+        target = np.ascontiguousarray(target)
+
         # Compute feature weights and rank.
-        if self.dist_func is not None:
-            # If distance function specified.
-            self.weights = Relief_jl.surf(data, target, self.dist_func, f_type=self.f_type)
-        else:
+        if self.algorithm == "kdtree":
+            # Use ball tree radius queries to restrict the neighbor scan. The
+            # shared neighbor-structure cache is keyed on the user-supplied
+            # array, so sibling estimators fit on the same data reuse it.
+            weights = kdtree_weights(data, target, self.f_type, "surf", n_jobs=self.n_jobs,
+                    key=make_key(raw_data, data.dtype, self.random_state), random_state=self.random_state)
+        elif self.algorithm != "brute":
+            raise ValueError("Unknown value \"{0}\" for parameter algorithm.".format(self.algorithm))
+        elif self.dist_func is None:
             # If distance function not specified, use default L1 distance (implemented in Julia).
-            self.weights = Relief_jl.surf(data, target, f_type=self.f_type)
-        self.rank = rankdata(-self.weights, method='ordinal')
+            weights = _julia_handles(self.n_jobs)['surf'](to_julia(data), to_julia(target), f_type=self.f_type)
+        elif hasattr(self.dist_func, 'address'):
+            # If compiled distance function (numba.cfunc) specified, pass its raw pointer to Julia.
+            weights = _julia_handles(self.n_jobs)['surf'](to_julia(data), to_julia(target), cfunc_dist(self.dist_func.address), f_type=self.f_type)
+        else:
+            # If Python distance function specified, keep handing it numpy
+            # float64 arrays (see skrelief._julia.numpy_dist).
+            weights = _julia_handles(self.n_jobs)['surf'](to_julia(data), to_julia(target), numpy_dist(self.dist_func), f_type=self.f_type)
+        # Store a detached copy of the weights, the selected columns and the
+        # lazily computed ranks (see skrelief._julia.store_weights).
+        store_weights(self, weights)
         
         # Return reference to self.
         return self
 
 
+    def fit_transform(self, data, target):
+        """
+        Rank features and immediately return the selected columns of data,
+        fusing fit() and transform() into a single pass.
+
+        Args:
+            data (numpy.ndarray): matrix of data samples
+            target (numpy.ndarray): vector of target values of samples
+
+        Returns:
+            (numpy.ndarray): result of performing feature selection.
+        """
+
+        self.fit(data, target)
+        return np.take(data, self._selected_cols, axis=1)
+
+
+    @property
+    def rank(self):
+        """
+        Ordinal ranks of the feature weights (rank 1 is the best feature).
+        Computed lazily on first access after fit().
+
+        Returns:
+            (numpy.ndarray): vector of feature ranks
+        """
+
+        if self._rank is None:
+            # Stable sort keeps scipy's ordinal tie-breaking by index.
+            order = np.argsort(-self.weights, kind='stable')
+            self._rank = np.empty_like(order)
+            self._rank[order] = np.arange(1, order.size + 1)
+        return self._rank
+
+
     def transform(self, data):
         """
         Perform feature selection using computed feature ranks.
@@ -71,6 +182,5 @@ class SURF(BaseEstimator, TransformerMixin):
         """
 
         # select n_features_to_select best features and return selected features.
-        msk = self.rank <= self.n_features_to_select  # Compute mask.
-        return data[:, msk]  # Perform feature selection.
+        return np.take(data, self._selected_cols, axis=1)  # Perform feature selection.
 
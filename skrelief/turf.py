@@ -2,11 +2,31 @@ import numpy as np
 from scipy.stats import rankdata
 from sklearn.base import BaseEstimator, TransformerMixin
 
-from julia import Julia
-Julia(compiled_modules=False)
-from julia import Relief as Relief_jl
+from skrelief._julia import load_relief
 from skrelief.relieff import Relieff
 
+# Handles to the Julia entry points used by fit(), filled in by
+# _julia_handles() on first use so importing this module does not boot Julia.
+_jl_handles = {}
+
+
+def _julia_handles():
+    """
+    Boot the Julia runtime on first call and return the cached handles to the
+    Relief entry points.
+
+    Returns:
+        (dict): mapping of handle names to Julia callables.
+    """
+
+    if not _jl_handles:
+        jl = load_relief()
+
+        # Bind the Julia entry point once so calls in fit() do not re-resolve
+        # the function through the Julia module proxy.
+        _jl_handles['turf'] = jl.Relief.turf
+    return _jl_handles
+
 
 class TuRF(BaseEstimator, TransformerMixin):
     """sklearn compatible implementation of the TuRF algorithm.
@@ -49,9 +69,9 @@ class TuRF(BaseEstimator, TransformerMixin):
 
         # Compute feature weights and rank.
         if self._rba is not None:
-            self.weights = Relief_jl.turf(data, target, self.num_it, self.rba_wrap)
+            self.weights = np.array(_julia_handles()['turf'](data, target, self.num_it, self.rba_wrap), dtype=np.float64)
         else:
-            self.weights = Relief_jl.turf(data, target, self.num_it)
+            self.weights = np.array(_julia_handles()['turf'](data, target, self.num_it), dtype=np.float64)
         self.rank = rankdata(-self.weights, method='ordinal')
         
         # Return reference to self.
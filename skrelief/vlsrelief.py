@@ -2,11 +2,31 @@ import numpy as np
 from scipy.stats import rankdata
 from sklearn.base import BaseEstimator, TransformerMixin
 
-from julia import Julia
-Julia(compiled_modules=False)
-from julia import Relief as Relief_jl
+from skrelief._julia import load_relief
 from skrelief.relieff import Relieff
 
+# Handles to the Julia entry points used by fit(), filled in by
+# _julia_handles() on first use so importing this module does not boot Julia.
+_jl_handles = {}
+
+
+def _julia_handles():
+    """
+    Boot the Julia runtime on first call and return the cached handles to the
+    Relief entry points.
+
+    Returns:
+        (dict): mapping of handle names to Julia callables.
+    """
+
+    if not _jl_handles:
+        jl = load_relief()
+
+        # Bind the Julia entry point once so calls in fit() do not re-resolve
+        # the function through the Julia module proxy.
+        _jl_handles['vlsrelief'] = jl.Relief.vlsrelief
+    return _jl_handles
+
 
 class VLSRelief(BaseEstimator, TransformerMixin):
     """sklearn compatible implementation of the VLSRelief algorithm.
@@ -57,12 +77,12 @@ class VLSRelief(BaseEstimator, TransformerMixin):
         # Compute feature weights and rank.
         if self.rba is not None:
             # If wrapped RBA specified.
-            self.weights = Relief_jl.vlsrelief(data, target, self.partition_size, 
-                    self.num_partitions_to_select, self.num_subsets, rba=self.rba)
+            self.weights = np.array(_julia_handles()['vlsrelief'](data, target, self.partition_size, 
+                    self.num_partitions_to_select, self.num_subsets, rba=self.rba), dtype=np.float64)
         else:
             # If wrapped RBA not specified, use default RBA (ReliefF implemented in Julia).
-            self.weights = Relief_jl.vlsrelief(data, target, self.partition_size, 
-                    self.num_partitions_to_select, self.num_subsets)
+            self.weights = np.array(_julia_handles()['vlsrelief'](data, target, self.partition_size, 
+                    self.num_partitions_to_select, self.num_subsets), dtype=np.float64)
         self.rank = rankdata(-self.weights, method='ordinal')
         
         # Return reference to self.
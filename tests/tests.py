@@ -72,6 +72,86 @@ def test_weights_ranks_transform():
 
 
 
+def test_kdtree_backend():
+    from skrelief import clear_distance_cache
+    from skrelief.multisurf import MultiSURF
+    from skrelief.surf import SURF
+    from skrelief.surfstar import SURFStar
+
+    # Set column indices for informative features.
+    IDX1 = 1
+    IDX2 = 3
+
+    # Define data for testing.
+    data_fit = np.random.rand(1000, 10)
+    data_transform = np.random.rand(1000, 10)
+    target = (data_fit[:, IDX1] > data_fit[:, IDX2]).astype(int)
+
+    # Test computation of weights, ranks and transform with the ball tree
+    # backend of the SURF-family estimators.
+    for rba_class in (MultiSURF, SURF, SURFStar):
+        print("Testing {0} (algorithm=\"kdtree\")".format(rba_class.__name__))
+
+        rba = rba_class(n_features_to_select=2, algorithm="kdtree", random_state=0)
+        rba.fit(data_fit, target)
+
+        # Check weights
+        weights = rba.weights
+        assert(np.all(weights[IDX1] > weights[np.logical_and(np.arange(len(weights)) != IDX1, np.arange(len(weights)) != IDX2)]))
+
+        # Check rankings
+        assert(set(rba.rank[[IDX1, IDX2]]) == {1, 2})
+
+        # Check transform
+        transformed = rba.transform(data_transform)
+        assert(transformed.shape == (data_transform.shape[0], 2))
+
+        # Check that fits with the same random_state reproduce the weights.
+        # The cache is cleared in between so both fits really recompute, and a
+        # fit with a different seed on the same array - which keys its own
+        # cache entry - must not return the first seed's weights.
+        clear_distance_cache()
+        weights_first = rba_class(n_features_to_select=2, algorithm="kdtree", random_state=42).fit(data_fit, target).weights
+        weights_other = rba_class(n_features_to_select=2, algorithm="kdtree", random_state=43).fit(data_fit, target).weights
+        clear_distance_cache()
+        weights_second = rba_class(n_features_to_select=2, algorithm="kdtree", random_state=42).fit(data_fit, target).weights
+        assert(np.array_equal(weights_first, weights_second))
+        assert(not np.array_equal(weights_first, weights_other))
+    clear_distance_cache()
+
+
+def test_distance_cache_reuse():
+    from skrelief import _distance_cache, clear_distance_cache
+    from skrelief.multisurf import MultiSURF
+    from skrelief.surf import SURF
+
+    # Define data for testing.
+    data_fit = np.random.rand(200, 10)
+    target = (data_fit[:, 1] > data_fit[:, 3]).astype(int)
+
+    # Fitting a second estimator on the same array must reuse the cached
+    # neighbor structures instead of adding an entry.
+    print("Testing distance cache reuse")
+    clear_distance_cache()
+    MultiSURF(n_features_to_select=2, algorithm="kdtree").fit(data_fit, target)
+    assert(len(_distance_cache._CACHE) == 1)
+    SURF(n_features_to_select=2, algorithm="kdtree").fit(data_fit, target)
+    assert(len(_distance_cache._CACHE) == 1)
+
+    # A different array gets its own entry.
+    data_other = np.random.rand(200, 10)
+    SURF(n_features_to_select=2, algorithm="kdtree").fit(data_other, (data_other[:, 1] > data_other[:, 3]).astype(int))
+    assert(len(_distance_cache._CACHE) == 2)
+
+    # Entries are evicted once their source array is garbage collected.
+    del data_other
+    assert(len(_distance_cache._CACHE) == 1)
+    clear_distance_cache()
+
+
+
 if __name__ == '__main__':
     test_weights_ranks_transform()
+    test_kdtree_backend()
+    test_distance_cache_reuse()
 